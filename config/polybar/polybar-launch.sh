@@ -8,19 +8,24 @@ killall -q polybar
 # Launch primary bar
 polybar top-primary 2>&1 | tee -a /tmp/polybar-primary.log & disown
 
-AUTORANDR_TERMINALEN=$(autorandr | grep terminalen | grep current)
+# Query autorandr once and reuse the output below
+AUTORANDR=$(autorandr)
+AUTORANDR_TERMINALEN=$(grep terminalen <<< "$AUTORANDR" | grep current)
+AUTORANDR_HOME=$(grep home-hdmi <<< "$AUTORANDR" | grep current)
+
+# Monitors are only needed for the docked profiles, list them once if one is active
+if [[ $AUTORANDR_TERMINALEN || $AUTORANDR_HOME ]]; then
+  MONITORS=$(xrandr --listmonitors)
+fi
 
 if [[ $AUTORANDR_TERMINALEN ]]; then
-  HOME_LEFT=$(xrandr --listmonitors | grep -o 'HDMI-1$')
+  HOME_LEFT=$(grep -o 'HDMI-1$' <<< "$MONITORS")
   if [[ $HOME_LEFT ]]; then polybar $HOME_LEFT 2>&1 | tee -a /tmp/polybar-$HOME_LEFT.log & disown; fi
 fi
 
-
-AUTORANDR_HOME=$(autorandr | grep home-hdmi | grep current)
-
 if [[ $AUTORANDR_HOME ]]; then
-  HOME_LEFT=$(xrandr --listmonitors | grep -o 'HDMI-1$')
-  HOME_RIGHT=$(xrandr --listmonitors | grep -o 'DP-2-3-8$')
+  HOME_LEFT=$(grep -o 'HDMI-1$' <<< "$MONITORS")
+  HOME_RIGHT=$(grep -o 'DP-2-3-8$' <<< "$MONITORS")
 
   if [[ $HOME_LEFT ]]; then polybar $HOME_LEFT 2>&1 | tee -a /tmp/polybar-$HOME_LEFT.log & disown; fi
   if [[ $HOME_RIGHT ]]; then polybar $HOME_RIGHT 2>&1 | tee -a /tmp/polybar-$HOME_RIGHT.log & disown; fi
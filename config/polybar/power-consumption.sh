@@ -1,36 +1,78 @@
 #!/bin/bash
 
-# Check if AC adapter is connected
-if [ -f "/sys/class/power_supply/ADP0/online" ]; then
-    ac_online=$(cat /sys/class/power_supply/ADP0/online)
-else
-    # Fallback for systems with different AC adapter naming
-    ac_online=0
-fi
-
-# Only show power consumption when on battery (ACAD/online == 0)
-if [ "$ac_online" -eq 0 ]; then
-    if [ -f "/sys/class/power_supply/BAT0/power_now" ] && \
-       [ -f "/sys/class/power_supply/BAT0/energy_now" ] && \
-       [ -f "/sys/class/power_supply/BAT0/energy_full" ]; then
-
-        power_uw=$(cat /sys/class/power_supply/BAT0/power_now)
-        energy_now_uw=$(cat /sys/class/power_supply/BAT0/energy_now)
-
-        # Convert microwatts to watts
-        power_w=$(echo "scale=1; $power_uw / 1000000" | bc)
-
-        # Calculate time remaining in minutes
-        # energy_now (µWh) / power_now (µW) = time (hours)
-        # Then multiply by 60 to get minutes
-        if [ "$power_uw" -gt 0 ]; then
-            time_minutes=$(echo "scale=3; ($energy_now_uw / $power_uw) * 60" | bc | cut -d. -f1)
-            echo "${power_w} W - ${time_minutes} min"
-        else
-            echo "${power_w} W"
-        fi
+# Runs as a polybar "tail" script: one long-lived process prints a line per
+# tick instead of polybar spawning a new shell every interval
+INTERVAL=${1:-1}
+
+# Waiting on a read from a pipe nobody writes to is a timed sleep without
+# forking /bin/sleep each tick
+exec {TICK_FD}<> <(:)
+
+# Resolve the power supply paths once instead of probing them every tick
+SUPPLY=/sys/class/power_supply
+AC_ONLINE=
+for ac in ADP0 ADP1 ACAD AC AC0; do
+    if [ -f "$SUPPLY/$ac/online" ]; then AC_ONLINE=$SUPPLY/$ac/online; break; fi
+done
+BATTERY=
+for bat in BAT0 BAT1; do
+    if [ -f "$SUPPLY/$bat/power_now" ] && \
+       [ -f "$SUPPLY/$bat/energy_now" ] && \
+       [ -f "$SUPPLY/$bat/energy_full" ]; then
+        BATTERY=$SUPPLY/$bat
+        break
     fi
-else
+done
+
+# Label printed last; polybar only needs a new line when it changes
+last_label=none
+
+while true; do
+    # An unchanged label is never written, so a vanished reader would not
+    # raise SIGPIPE. Exit once the parent (polybar) is gone
+    kill -0 "$PPID" 2>/dev/null || exit
+
     # Show nothing when plugged in
-    echo ""
-fi
+    label=""
+
+    # Check if AC adapter is connected
+    if [ -n "$AC_ONLINE" ]; then
+        read -r ac_online < "$AC_ONLINE"
+    else
+        # No known AC adapter, assume running on battery
+        ac_online=0
+    fi
+
+    # Only show power consumption when on battery (ACAD/online == 0)
+    if [ "$ac_online" -eq 0 ]; then
+        if [ -n "$BATTERY" ]; then
+            read -r power_uw < "$BATTERY/power_now"
+            read -r energy_now_uw < "$BATTERY/energy_now"
+
+            # Convert microwatts to watts, truncated to one decimal. Some
+            # drivers report a signed value, so format the magnitude and put
+            # the sign back in front
+            sign=
+            abs_uw=$power_uw
+            if [ "$power_uw" -lt 0 ]; then sign=-; abs_uw=$((-power_uw)); fi
+            power_w=$sign$((abs_uw / 1000000)).$((abs_uw % 1000000 / 100000))
+
+            # Calculate time remaining in minutes
+            # energy_now (µWh) / power_now (µW) = time (hours)
+            # Then multiply by 60 to get minutes
+            if [ "$power_uw" -gt 0 ]; then
+                time_minutes=$((energy_now_uw * 60 / power_uw))
+                label="${power_w} W - ${time_minutes} min"
+            else
+                label="${power_w} W"
+            fi
+        fi
+    fi
+
+    if [ "$label" != "$last_label" ]; then
+        echo "$label"
+        last_label=$label
+    fi
+
+    read -rt "$INTERVAL" -u "$TICK_FD"
+done
@@ -1,7 +1,54 @@
 #!/bin/bash
-mkdir -p ~/Pictures
-ln -s $(pwd)/config/alacritty ~/.config/alacritty
-# ln -s $(pwd)/config/autorandr ~/.config/autorandr
-ln -s $(pwd)/config/i3 ~/.config/i3
-ln -s $(pwd)/config/polybar ~/.config/polybar
-ln -s $(pwd)/background.jpg ~/Pictures/background.jpg
+
+# Backups are always reported, set DOTFILES_VERBOSE to also list every new link
+VERBOSE=${DOTFILES_VERBOSE:-}
+# Set when any step fails so the script can exit non-zero
+FAILED=0
+
+# Link $1 to $2, moving an existing destination to $2.backup first. Only the
+# first backup is kept, a later run only replaces a destination that is a
+# symlink and refuses to touch real files or directories
+link() {
+    local src=$1 dest=$2 backup=$2.backup
+    # Already installed, checked with builtin tests so a re-run never has to
+    # start ln or readlink
+    [[ -L $dest && $dest -ef $src ]] && return
+    # Move a taken destination aside first, so the single ln below reports
+    # its own error when it still fails. Each step stops at its first failure,
+    # the tool has already said why
+    if [[ -L $dest || -e $dest ]]; then
+        if [[ -L $backup || -e $backup ]]; then
+            if [[ ! -L $dest ]]; then
+                echo "Not replacing $dest, $backup already exists" >&2
+                return 1
+            fi
+            echo "Replacing $dest (was -> $(readlink "$dest"))" >&2
+            rm -f "$dest" || return
+        else
+            mv "$dest" "$backup" || return
+            echo "Backed up $dest to $backup"
+        fi
+    fi
+    # -T keeps ln from linking inside an existing directory
+    ln -sT "$src" "$dest" || return
+    if [[ $VERBOSE ]]; then echo "Linked $dest -> $src"; fi
+}
+
+# Resolve the roots once instead of forking a $(pwd) subshell per entry. The
+# repo root comes from the script's own location so running it from another
+# directory cannot link to paths that don't exist. CDPATH is cleared so cd
+# prints nothing into the result
+SCRIPT_DIR=.
+[[ ${BASH_SOURCE[0]} == */* ]] && SCRIPT_DIR=${BASH_SOURCE[0]%/*}
+DOTFILES=$(CDPATH= cd -- "$SCRIPT_DIR" && pwd) || exit 1
+CONFIG=~/.config
+
+# Create every destination parent up front in a single mkdir
+mkdir -p "$CONFIG" ~/Pictures || FAILED=1
+link "$DOTFILES/config/alacritty" "$CONFIG/alacritty" || FAILED=1
+# link "$DOTFILES/config/autorandr" "$CONFIG/autorandr" || FAILED=1
+link "$DOTFILES/config/i3" "$CONFIG/i3" || FAILED=1
+link "$DOTFILES/config/polybar" "$CONFIG/polybar" || FAILED=1
+link "$DOTFILES/background.jpg" ~/Pictures/background.jpg || FAILED=1
+
+exit "$FAILED"